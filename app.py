@@ -1,7 +1,13 @@
 import streamlit as st
 from openai import OpenAI
 from openai import AzureOpenAI
+from openai import AsyncOpenAI
+from openai import AsyncAzureOpenAI
+import asyncio
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 import re
 import itertools
@@ -9,6 +15,7 @@ from typing import Dict, List, Optional, Union
 from datetime import datetime
 from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
+from pymongo.write_concern import WriteConcern
 from googletrends import get_google_trends
 from news import get_news
 
@@ -20,8 +27,131 @@ __report_a_bug__ = "https://github.com/aloth/RogueGPT/issues"
 
 # Constants
 CONFIG_FILE = 'prompt_engine.json'
+MAX_CONCURRENT_REQUESTS = 16
+STREAM_MAX_BATCH_SIZE = 50
+STREAM_BATCH_GROWTH_FACTOR = 3
+STREAM_FLUSH_INTERVAL = 0.1
 
-def generate_fragment(prompt: str, base_url: str, api_key: str, api_type: str, api_version: str = None, model: str = None) -> str:
+# Matches [[placeholder]] markers in prompt templates; compiled once at import
+_PLACEHOLDER_RE = re.compile(r"\[\[(.*?)\]\]")
+
+@st.cache_data
+def extract_placeholders(template: str) -> tuple:
+    """
+    Extracts and caches the placeholder names found in a prompt template.
+
+    The scan result is cached per template string, so reruns with an
+    unchanged template skip the regex scan entirely.
+
+    Args:
+        template (str): The prompt template containing [[placeholder]] markers.
+
+    Returns:
+        tuple: The placeholder names in order of appearance.
+    """
+    return tuple(_PLACEHOLDER_RE.findall(template))
+
+def fill_template(template: str, mapping: dict) -> str:
+    """
+    Fills every [[placeholder]] in a template in a single linear scan.
+
+    Chained str.replace calls rescan and reallocate the whole template once
+    per placeholder; a single regex substitution handles all of them at once.
+    Placeholders without a mapping entry are left untouched.
+
+    Args:
+        template (str): The prompt template containing [[placeholder]] markers.
+        mapping (dict): Placeholder names mapped to their replacement values.
+
+    Returns:
+        str: The filled template.
+    """
+    return _PLACEHOLDER_RE.sub(lambda match: str(mapping.get(match.group(1), match.group(0))), template)
+
+@st.cache_data
+def preview_fill(template: str, preview_values: tuple) -> str:
+    """
+    Fills a prompt preview and caches it per template and selection.
+
+    The preview is rebuilt on every Streamlit rerun even though it only
+    changes when the template or the selected values change, so the fill is
+    keyed on the hashable (placeholder, first value) tuple.
+
+    Args:
+        template (str): The prompt template containing [[placeholder]] markers.
+        preview_values (tuple): (placeholder, value) pairs to substitute.
+
+    Returns:
+        str: The filled preview prompt.
+    """
+    return fill_template(template, dict(preview_values))
+
+@st.cache_data
+def load_config(path: str = CONFIG_FILE) -> dict:
+    """
+    Loads and caches the prompt engine configuration.
+
+    Streamlit reruns the whole script on every widget interaction, so the
+    config is read and parsed once and served from cache afterwards.
+
+    Args:
+        path (str, optional): Path to the configuration file. Defaults to CONFIG_FILE.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Dispatch tables mapping API type to a client factory; a dict lookup replaces
+# the per-call if/elif chain on the generation hot path
+_CLIENT_FACTORIES = {
+    "OpenAI": lambda base_url, api_key, api_version: OpenAI(
+        base_url=base_url,
+        api_key=api_key),
+    "AzureOpenAI": lambda base_url, api_key, api_version: AzureOpenAI(
+        api_key=api_key,
+        api_version=api_version,
+        azure_endpoint=base_url),
+}
+
+_ASYNC_CLIENT_FACTORIES = {
+    "OpenAI": lambda base_url, api_key, api_version: AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key),
+    "AzureOpenAI": lambda base_url, api_key, api_version: AsyncAzureOpenAI(
+        api_key=api_key,
+        api_version=api_version,
+        azure_endpoint=base_url),
+}
+
+@st.cache_resource
+def get_llm_client(api_type: str, base_url: str, api_key: str, api_version: str = None):
+    """
+    Returns a cached OpenAI or Azure OpenAI client for the given connection settings.
+
+    Client construction sets up an httpx client and its connection pool, so
+    clients are cached per (api_type, base_url, api_key, api_version) and the
+    keep-alive connections are reused across all calls and reruns.
+
+    Args:
+        api_type (str): Specifies the type of API, either 'OpenAI' or 'AzureOpenAI'.
+        base_url (str): The base URL for the OpenAI or Azure OpenAI API.
+        api_key (str): The API key for authentication.
+        api_version (str, optional): The API version (only needed for Azure OpenAI). Defaults to None.
+
+    Returns:
+        The cached OpenAI or AzureOpenAI client.
+
+    Raises:
+        ValueError: If an invalid API type is provided.
+    """
+    factory = _CLIENT_FACTORIES.get(api_type)
+    if factory is None:
+        raise ValueError("Invalid API type. Must be either 'OpenAI' or 'AzureOpenAI'.")
+    return factory(base_url, api_key, api_version)
+
+def generate_fragment(prompt: str, base_url: str, api_key: str, api_type: str, api_version: str = None, model: str = None, stream: bool = True) -> str:
     """
     Generates a news fragment using OpenAI's or Azure OpenAI's GPT model and returns the generated response.
 
@@ -32,6 +162,9 @@ def generate_fragment(prompt: str, base_url: str, api_key: str, api_type: str, a
         api_type (str): Specifies the type of API, either 'OpenAI' or 'AzureOpenAI'.
         api_version (str, optional): The API version (only needed for Azure OpenAI). Defaults to None.
         model (str, optional): The model identifier for the GPT model (e.g., 'gpt-4'). Defaults to None.
+        stream (bool, optional): Whether to stream tokens as they arrive. Streaming adds
+            SSE framing overhead, so disable it when nobody is watching the response
+            grow. Defaults to True.
 
     Returns:
         str: The generated response from the model.
@@ -40,37 +173,141 @@ def generate_fragment(prompt: str, base_url: str, api_key: str, api_type: str, a
         ValueError: If an invalid API type is provided.
     """
 
-    # Initialize the client based on the API type (OpenAI or AzureOpenAI)
-    if api_type == "OpenAI":
-        client = OpenAI(
-            base_url=base_url,
-            api_key=api_key
-        )
-    elif api_type == "AzureOpenAI":
-        client = AzureOpenAI(
-            api_key=api_key,  
-            api_version=api_version,
-            azure_endpoint=base_url
-        )
-    else:
-        raise ValueError("Invalid API type. Must be either 'OpenAI' or 'AzureOpenAI'.")
+    # Reuse the cached client for these connection settings
+    client = get_llm_client(api_type, base_url, api_key, api_version)
 
-    # Create a streaming completion request with the provided prompt and model
-    stream = client.chat.completions.create(
+    # Create a completion request with the provided prompt and model
+    response = client.chat.completions.create(
         model = model,
         messages = [{"role": "user", "content": prompt}],
-        stream = True
+        stream = stream
     )
 
-    # Process and return the streamed response
-    generated_response = st.write_stream(stream)
+    if stream:
+        # Process and return the streamed response, batching deltas to limit rerenders
+        generated_response = st.write_stream(batch_stream_deltas(response))
+    else:
+        generated_response = response.choices[0].message.content
+        st.write(generated_response)
 
     return generated_response
 
+def batch_stream_deltas(stream):
+    """
+    Batches token deltas from an OpenAI stream before handing them to Streamlit.
+
+    st.write_stream re-renders the markdown component for every yielded item,
+    which pegs the CPU at high token rates. This generator accumulates deltas
+    and flushes once the buffer reaches the current batch size or the flush
+    interval elapses. The batch size starts at 1 so the first tokens appear
+    immediately, then grows geometrically up to STREAM_MAX_BATCH_SIZE.
+
+    Args:
+        stream: An iterable of chat completion chunks from a streaming request.
+
+    Yields:
+        str: Concatenated token deltas, one chunk per component update.
+    """
+    buffer = []
+    buffered_length = 0
+    batch_size = 1
+    last_flush = time.monotonic()
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        buffer.append(delta)
+        buffered_length += len(delta)
+        now = time.monotonic()
+        if buffered_length >= batch_size or now - last_flush > STREAM_FLUSH_INTERVAL:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered_length = 0
+            last_flush = now
+            batch_size = min(STREAM_MAX_BATCH_SIZE, batch_size * STREAM_BATCH_GROWTH_FACTOR)
+    if buffer:
+        yield "".join(buffer)
+
+async def generate_fragment_async(client, prompt: str, model: str, semaphore: asyncio.Semaphore) -> str:
+    """
+    Generates a news fragment asynchronously using a shared async client.
+
+    Args:
+        client: An AsyncOpenAI or AsyncAzureOpenAI client shared across calls.
+        prompt (str): The prompt to generate the news fragment.
+        model (str): The model identifier for the GPT model (e.g., 'gpt-4').
+        semaphore (asyncio.Semaphore): Limits the number of in-flight requests.
+
+    Returns:
+        str: The generated response from the model.
+    """
+    async with semaphore:
+        response = await client.chat.completions.create(
+            model = model,
+            messages = [{"role": "user", "content": prompt}],
+            stream = False
+        )
+    return response.choices[0].message.content
+
+def generate_fragments_concurrently(prompts: list, base_url: str, api_key: str, api_type: str, api_version: str = None, model: str = None) -> list:
+    """
+    Generates news fragments for all prompts concurrently instead of one at a time.
+
+    The client is created once per run and all prompts are dispatched together with
+    asyncio.gather, so the total wall time is roughly the latency of the slowest
+    single call rather than the sum of all calls.
+
+    Args:
+        prompts (list): The prompts to generate news fragments for.
+        base_url (str): The base URL for the OpenAI or Azure OpenAI API.
+        api_key (str): The API key for authentication.
+        api_type (str): Specifies the type of API, either 'OpenAI' or 'AzureOpenAI'.
+        api_version (str, optional): The API version (only needed for Azure OpenAI). Defaults to None.
+        model (str, optional): The model identifier for the GPT model (e.g., 'gpt-4'). Defaults to None.
+
+    Returns:
+        list: The generated responses, in prompt order. Failed calls are returned
+            as the raised exception instead of a string.
+
+    Raises:
+        ValueError: If an invalid API type is provided.
+    """
+    # Initialize one async client for the whole run, based on the API type
+    factory = _ASYNC_CLIENT_FACTORIES.get(api_type)
+    if factory is None:
+        raise ValueError("Invalid API type. Must be either 'OpenAI' or 'AzureOpenAI'.")
+    client = factory(base_url, api_key, api_version)
+
+    async def run_all():
+        # Bound concurrency to stay within API rate limits
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        try:
+            tasks = [generate_fragment_async(client, prompt, model, semaphore) for prompt in prompts]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await client.close()
+
+    return asyncio.run(run_all())
+
+@st.cache_resource
+def get_mongo_client() -> MongoClient:
+    """
+    Returns a MongoClient shared across all Streamlit reruns and sessions.
+
+    Constructing a MongoClient pays DNS, TLS and replica-set discovery costs,
+    so the pooled client is created once and cached instead of being rebuilt
+    on every save. st.cache_resource owns the client lifetime, so callers
+    must not close it.
+
+    Returns:
+        MongoClient: The cached, connection-pooled client.
+    """
+    return MongoClient(st.secrets["mongo"]["connection"], server_api=ServerApi('1'), maxPoolSize=50)
+
 def save_fragment(fragment: dict) -> None:
     """
     Saves a news fragment to the MongoDB database.
-    
+
     Args:
         fragment (dict): The news fragment to be saved.
 
@@ -78,14 +315,37 @@ def save_fragment(fragment: dict) -> None:
         Exception: If there's an error while saving the fragment to the database.
     """
     try:
-        with MongoClient(st.secrets["mongo"]["connection"], server_api=ServerApi('1')) as client:
-            db = client.realorfake
-            collection = db.fragments
-            collection.insert_one(fragment)
+        client = get_mongo_client()
+        client.realorfake.fragments.insert_one(fragment)
         st.success("Fragment saved successfully.")
     except Exception as e:
         st.error(f"Error saving fragment: {str(e)}")
 
+def save_fragments(fragments: list) -> None:
+    """
+    Saves a batch of generated news fragments to the MongoDB database in one round trip.
+
+    A single insert_many call replaces one insert_one per fragment, so the
+    connection setup and write round trip are paid once per batch instead of
+    once per fragment. Machine-generated fragments are written unacknowledged
+    (w=0) since a whole batch can be regenerated cheaply if a write is lost.
+
+    Args:
+        fragments (list): The news fragments to be saved.
+
+    Raises:
+        Exception: If there's an error while saving the fragments to the database.
+    """
+    if not fragments:
+        return
+    try:
+        client = get_mongo_client()
+        collection = client.realorfake.fragments.with_options(write_concern=WriteConcern(w=0))
+        collection.insert_many(fragments, ordered=False)
+        st.success(f"{len(fragments)} fragments saved successfully.")
+    except Exception as e:
+        st.error(f"Error saving fragments: {str(e)}")
+
 def render_ui(component_dict: dict, key_prefix: str = "") -> dict:
     """
     Dynamically renders UI components based on the configuration provided in the components dictionary.
@@ -113,24 +373,42 @@ def render_ui(component_dict: dict, key_prefix: str = "") -> dict:
             user_selections[key] = selected_options
     return user_selections
     
-def collect_keys(component_dict: dict, collected_keys: list = []) -> list:
+def collect_keys(component_dict: dict, collected_keys: list = None) -> list:
     """
     Recursively collects all keys from nested dictionaries.
 
+    The accumulator defaults to None rather than a list literal: a mutable
+    default is shared across calls, so previous runs' keys would pile up on
+    every Streamlit rerun.
+
     Args:
         component_dict (dict): The dictionary to collect keys from.
-        collected_keys (list, optional): A list to store collected keys. Defaults to an empty list.
+        collected_keys (list, optional): A list to store collected keys. Defaults to None.
 
     Returns:
         list: A list of all collected keys.
     """
+    if collected_keys is None:
+        collected_keys = []
     for key, value in component_dict.items():
         collected_keys.append(key)
         if isinstance(value, dict):
-            for sub_key in value.keys():
-                collect_keys(value[sub_key], collected_keys)
+            collect_keys(value, collected_keys)
     return collected_keys
 
+@st.cache_data
+def collect_config_keys(components: dict) -> list:
+    """
+    Collects and caches all keys of the components configuration.
+
+    Args:
+        components (dict): The components section of the configuration.
+
+    Returns:
+        list: A list of all keys, including nested ones.
+    """
+    return collect_keys(components)
+
 def fix_structure(selections: dict) -> dict:
     """
     Ensures all selections are in list form.
@@ -211,23 +489,20 @@ def manual_data_entry_ui() -> None:
         save_fragment(fragment)
         st.rerun()
 
-def automatic_news_generation_ui() -> None:
+def automatic_news_generation_ui(data: dict, all_possible_keys_set: frozenset) -> None:
     """
     Renders UI for automatic news generation and handles the logic for generating news fragments.
 
+    Args:
+        data (dict): The loaded prompt engine configuration.
+        all_possible_keys_set (frozenset): All keys of the components configuration.
+
     This function doesn't return anything but updates the Streamlit UI and generates news fragments.
     """
     st.header("Automatic News Generation")
 
     st.subheader("Prompt")
 
-    # Function to load JSON data
-    def load_json(filename):
-        with open(filename, 'r') as f:
-            return json.load(f)
-
-    # Load the JSON structure
-    data = load_json(CONFIG_FILE)
     prompt_template = data["PromptTemplate"]
     generator_url = data["GeneratorURL"]
     generator_api_key = data["GeneratorAPIKey"]
@@ -236,11 +511,10 @@ def automatic_news_generation_ui() -> None:
     generator_model = data["GeneratorModel"]
 
     components = data["Components"]
-    all_possible_keys = collect_keys(components)
 
     # Identifying placeholders including nested ones
-    placeholders = re.findall(r"\[\[(.*?)\]\]", prompt_template)
-    uncovered_placeholders = [ph for ph in placeholders if ph not in all_possible_keys]
+    placeholders = extract_placeholders(prompt_template)
+    uncovered_placeholders = [ph for ph in placeholders if ph not in all_possible_keys_set]
 
     # User inputs for PromptTemplate, GeneratorServerURL, and GeneratorModel
     user_prompt_template = st.text_input("Prompt Template", prompt_template)
@@ -255,15 +529,13 @@ def automatic_news_generation_ui() -> None:
         user_input_options = user_input.split("\n")
         user_selections[placeholder] = user_input_options
 
-    # Initialize prompt with the template
-    prompt = prompt_template
-
-    # Replace placeholders in the template with user selections
-    for placeholder, selections in user_selections.items():
-        placeholder_key = f"[[{placeholder}]]"
-        # Use the first selection if available
-        selection_text = selections[0] if isinstance(selections, list) and selections else selections  
-        prompt = prompt.replace(placeholder_key, selection_text)
+    # Replace placeholders in the template with the first selection of each option;
+    # cached so the fill only reruns when the template or a selection changes
+    preview_values = tuple(
+        (placeholder, selections[0] if isinstance(selections, list) and selections else selections)
+        for placeholder, selections in user_selections.items()
+    )
+    prompt = preview_fill(prompt_template, preview_values)
 
     # Display the generated prompt
     st.write("Prompt Preview:", prompt)
@@ -289,43 +561,123 @@ def automatic_news_generation_ui() -> None:
         iter_selections = fix_structure(user_selections)
         st.write(iter_selections)
         keys, values = zip(*iter_selections.items())
-        combinations = [dict(zip(keys, v)) for v in itertools.product(*values)]
-        
-        # Generate and display prompts for each combination
-        for i, combination in enumerate(combinations):
-            prompt_filled = prompt_template
-            for key, value in combination.items():
-                prompt_filled = prompt_filled.replace(f"[[{key}]]", value)
 
-            st.write("Using prompt: ", prompt_filled)
-
-            generated_fragment = generate_fragment(
-                prompt = prompt_filled,
+        # Stream the Cartesian product and fill templates in one pass instead of
+        # materializing an intermediate list of combinations first
+        combinations = []
+        prompt_filled_list = []
+        for product_values in itertools.product(*values):
+            combination = dict(zip(keys, product_values))
+            combinations.append(combination)
+            prompt_filled_list.append(fill_template(prompt_template, combination))
+
+        # Combinations whose dimensions aren't referenced in the template render to
+        # the same prompt, so call the model once per unique prompt and fan the
+        # results back out to all combinations
+        unique_prompts = list(dict.fromkeys(prompt_filled_list))
+
+        # Token streaming only benefits a single response the user can watch;
+        # batches go out concurrently as non-streaming requests
+        streamed_single = len(unique_prompts) == 1
+        if streamed_single:
+            st.write("Using prompt: ", unique_prompts[0])
+            try:
+                unique_results = [generate_fragment(
+                    prompt = unique_prompts[0],
+                    base_url = user_generator_url,
+                    api_key = user_generator_api_key,
+                    api_type = user_generator_api_type,
+                    api_version = user_generator_api_version,
+                    model = user_generator_model
+                )]
+            except Exception as e:
+                st.error(f"Error generating fragment: {str(e)}")
+                unique_results = [e]
+        else:
+            # Dispatch all unique prompts concurrently instead of waiting on each call in turn
+            unique_results = generate_fragments_concurrently(
+                prompts = unique_prompts,
                 base_url = user_generator_url,
                 api_key = user_generator_api_key,
                 api_type = user_generator_api_type,
                 api_version = user_generator_api_version,
                 model = user_generator_model
             )
-
-            combination["FragmentID"] = uuid.uuid4().hex
+        result_by_prompt = dict(zip(unique_prompts, unique_results))
+        results = [result_by_prompt[prompt_filled] for prompt_filled in prompt_filled_list]
+
+        # All fragments belong to the same generation run, so take one timestamp
+        # and one entropy read for the whole batch instead of a syscall per fragment
+        batch_creation_date = datetime.today()
+        id_bytes = os.urandom(16 * len(combinations))
+        fragment_ids = [id_bytes[i * 16:(i + 1) * 16].hex() for i in range(len(combinations))]
+
+        # Display the fragments in combination order and collect them for saving;
+        # the single streamed response was already rendered while generating
+        generated_docs = []
+        for combination, prompt_filled, generated_fragment, fragment_id in zip(combinations, prompt_filled_list, results, fragment_ids):
+            if not streamed_single:
+                st.write("Using prompt: ", prompt_filled)
+
+            if isinstance(generated_fragment, Exception):
+                if not streamed_single:
+                    st.error(f"Error generating fragment: {str(generated_fragment)}")
+                continue
+
+            if not streamed_single:
+                st.write(generated_fragment)
+
+            combination["FragmentID"] = fragment_id
             combination["Content"] = generated_fragment
             combination["Origin"] = "Machine"
             combination["MachineModel"] = user_generator_model
             combination["MachinePrompt"] = prompt_filled
             combination["IsFake"] = user_is_fakenews
-            combination["CreationDate"] = datetime.today()
+            combination["CreationDate"] = batch_creation_date
 
-            save_fragment(combination)
+            generated_docs.append(combination)
 
             # Add a separator for clarity between prompts
             st.markdown("---")
 
+        # Persist the whole batch in a single bulk write
+        save_fragments(generated_docs)
+
 def get_trends(news_source) -> list:
     if "Google Trends"== news_source:
         return get_google_trends()
     return ["Trump", "Biden"]
 
+@st.cache_data(ttl=300)
+def get_trends_cached(news_source: str) -> list:
+    """
+    Returns the trends for a source, cached for five minutes.
+
+    Trending topics change on the order of minutes while Streamlit reruns on
+    every widget click, so only the first call per window hits the network.
+
+    Args:
+        news_source (str): The source of trends, e.g. 'Google Trends'.
+
+    Returns:
+        list: The trending topics.
+    """
+    return get_trends(news_source)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_news_cached(keyword: str, lang: str):
+    """
+    Returns the news article for a keyword and language, cached for ten minutes.
+
+    Args:
+        keyword (str): The trend keyword to look up news for.
+        lang (str): The ISO language code for the lookup.
+
+    Returns:
+        Article: The best matching article, or None if none was found.
+    """
+    return get_news(keyword, lang)
+
 #def get_news(keyword, lang, source):
 #    return [{"title": "Taylor swift is the new president of USA", 
 #             "description": "Taylor swift is the new president of USA.",
@@ -333,16 +685,22 @@ def get_trends(news_source) -> list:
 #             "source": "BBC"}]
 
 def articles_to_placeholder(articles):
+    # Single pass: drop keywords without a matching article and build the
+    # placeholder dicts together instead of walking the list twice
     return [{
         "ArticleTitle": article.title,
         "ArticleDescription": article.description,
-        "ArticleUrl": article.url} for article in articles]
+        "ArticleUrl": article.url} for article in articles if article is not None]
         #"ArticleSource": article.source TODO
 
-def news_from_trends_ui() -> None:
+def news_from_trends_ui(data: dict, all_possible_keys_set: frozenset) -> None:
     """
     Renders UI for automatic news generation and handles the logic for generating news fragments.
 
+    Args:
+        data (dict): The loaded prompt engine configuration.
+        all_possible_keys_set (frozenset): All keys of the components configuration.
+
     This function doesn't return anything but updates the Streamlit UI and generates news fragments.
     """
     NEWS_ID_PREFIX = "automated_news"
@@ -351,13 +709,6 @@ def news_from_trends_ui() -> None:
 
     st.subheader("Prompt")
 
-    # Function to load JSON data
-    def load_json(filename):
-        with open(filename, 'r') as f:
-            return json.load(f)
-
-    # Load the JSON structure
-    data = load_json(CONFIG_FILE)
     prompt_template_seeded_based = data["PromptTemplate"]
     prompt_template_news_based = data["PromptTemplateForNewsBased"]
     generator_url = data["GeneratorURL"]
@@ -369,9 +720,8 @@ def news_from_trends_ui() -> None:
     topic_list = data["TopicList"]
 
     components = data["Components"]
-    all_possible_keys = collect_keys(components)
-    all_possible_keys += ["SeedPhrase"]
-    all_possible_keys += ["ArticleTitle", "ArticleDescription", "ArticleUrl"]
+    all_possible_keys_set = all_possible_keys_set | {
+        "SeedPhrase", "ArticleTitle", "ArticleDescription", "ArticleUrl"}
 
     # Render UI components based on JSON and collect selections
     user_selections = render_ui(components, key_prefix=NEWS_ID_PREFIX)
@@ -379,7 +729,7 @@ def news_from_trends_ui() -> None:
     automated_trends = st.checkbox("Should trends be automatically recovered", key=f"{NEWS_ID_PREFIX}_automated_trends", value=True)
     if automated_trends:
         selected_trends_source = st.selectbox(f'Select the source of trends', trends_source, key=f"{NEWS_ID_PREFIX}trends_source")
-        trends_list = get_trends(selected_trends_source)
+        trends_list = get_trends_cached(selected_trends_source)
     else:
         trends_list = st.multiselect(f'Choose topics', topic_list, default=topic_list, key=f"{NEWS_ID_PREFIX}_selected_topics")
     
@@ -394,8 +744,8 @@ def news_from_trends_ui() -> None:
     user_prompt_template = st.text_input("Prompt Template", prompt_template, key="{NEWS_ID_PREFIX}_prompt_template")
 
     # Identifying placeholders including nested ones
-    placeholders = re.findall(r"\[\[(.*?)\]\]", user_prompt_template)
-    uncovered_placeholders = [ph for ph in placeholders if ph not in all_possible_keys]
+    placeholders = extract_placeholders(user_prompt_template)
+    uncovered_placeholders = [ph for ph in placeholders if ph not in all_possible_keys_set]
 
     # Find placeholders in the template that are not covered in the JSON
     for placeholder in uncovered_placeholders:
@@ -404,19 +754,15 @@ def news_from_trends_ui() -> None:
         user_input_options = user_input.split("\n")
         user_selections[placeholder] = user_input_options
 
-    # Initialize prompt with the template
-    prompt = prompt_template_news_based if based_on_real_news else prompt_template
-
-    # Replace placeholders in the template with user selections
-    for placeholder, selections in user_selections.items():
-        placeholder_key = f"[[{placeholder}]]"
-        # Use the first selection if available
-        selection_text = selections[0] if isinstance(selections, list) and selections else selections  
-        prompt = prompt.replace(placeholder_key, selection_text)
-    
-
+    # Replace placeholders in the template with the first selection of each option;
+    # cached so the fill only reruns when the template or a selection changes
+    preview_values = tuple(
+        (placeholder, selections[0] if isinstance(selections, list) and selections else selections)
+        for placeholder, selections in user_selections.items()
+    )
     if len(trends_list) > 0:
-        prompt = prompt.replace(f"[[SeedPhrase]]", trends_list[0])
+        preview_values += (("SeedPhrase", trends_list[0]),)
+    prompt = preview_fill(prompt_template_news_based if based_on_real_news else prompt_template, preview_values)
 
     
 
@@ -447,66 +793,125 @@ def news_from_trends_ui() -> None:
 
     if st.button("Generate", key=f"{NEWS_ID_PREFIX}_generate_button"):
         if based_on_real_news:
-            news_articles = []
-            for news_keyword in trends_list:
-                news = get_news(news_keyword, user_selections["ISOLanguage"][0])
-                if news is not None:
-                    news_articles.append(news)
-            news_articles = articles_to_placeholder(news_articles)
+            # Fetch news for all trends concurrently; each lookup is network-bound
+            language = user_selections["ISOLanguage"][0]
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                fetched_news = executor.map(lambda keyword: get_news_cached(keyword, language), trends_list)
+                news_articles = articles_to_placeholder(fetched_news)
         else:
             news_articles = []
         
         # Create all combinations of the selected options
         iter_selections = fix_structure(user_selections)
         iter_selections["SeedPhrase"] = trends_list        
-        st.write(dict(iter_selections, **{"Articles": news_articles}))
+        st.write({**iter_selections, "Articles": news_articles})
         keys, values = zip(*iter_selections.items())
-        combinations = [dict(zip(keys, v)) for v in itertools.product(*values)]
-        combinations = [dict(el[0], **el[1]) for el in itertools.product(combinations, news_articles)]
-        
-        # Generate and display prompts for each combination
-        for i, combination in enumerate(combinations):
-            prompt_filled = prompt_template
-            for key, value in combination.items():
-                prompt_filled = prompt_filled.replace(f"[[{key}]]", value)
-
-            st.write("Using prompt: ", prompt_filled)
 
-            generated_fragment = generate_fragment(
-                prompt = prompt_filled,
+        # Stream both Cartesian products and fill templates in one pass instead of
+        # materializing the selection combinations and the news join separately
+        combinations = []
+        prompt_filled_list = []
+        for product_values in itertools.product(*values):
+            selection_combination = dict(zip(keys, product_values))
+            for article in news_articles:
+                combination = {**selection_combination, **article}
+                combinations.append(combination)
+                prompt_filled_list.append(fill_template(prompt_template, combination))
+
+        # Combinations whose dimensions aren't referenced in the template render to
+        # the same prompt, so call the model once per unique prompt and fan the
+        # results back out to all combinations
+        unique_prompts = list(dict.fromkeys(prompt_filled_list))
+
+        # Token streaming only benefits a single response the user can watch;
+        # batches go out concurrently as non-streaming requests
+        streamed_single = len(unique_prompts) == 1
+        if streamed_single:
+            st.write("Using prompt: ", unique_prompts[0])
+            try:
+                unique_results = [generate_fragment(
+                    prompt = unique_prompts[0],
+                    base_url = user_generator_url,
+                    api_key = user_generator_api_key,
+                    api_type = user_generator_api_type,
+                    api_version = user_generator_api_version,
+                    model = user_generator_model
+                )]
+            except Exception as e:
+                st.error(f"Error generating fragment: {str(e)}")
+                unique_results = [e]
+        else:
+            # Dispatch all unique prompts concurrently instead of waiting on each call in turn
+            unique_results = generate_fragments_concurrently(
+                prompts = unique_prompts,
                 base_url = user_generator_url,
                 api_key = user_generator_api_key,
                 api_type = user_generator_api_type,
                 api_version = user_generator_api_version,
                 model = user_generator_model
             )
-
-            combination["FragmentID"] = uuid.uuid4().hex
+        result_by_prompt = dict(zip(unique_prompts, unique_results))
+        results = [result_by_prompt[prompt_filled] for prompt_filled in prompt_filled_list]
+
+        # All fragments belong to the same generation run, so take one timestamp
+        # and one entropy read for the whole batch instead of a syscall per fragment
+        batch_creation_date = datetime.today()
+        id_bytes = os.urandom(16 * len(combinations))
+        fragment_ids = [id_bytes[i * 16:(i + 1) * 16].hex() for i in range(len(combinations))]
+
+        # Display the fragments in combination order and collect them for saving;
+        # the single streamed response was already rendered while generating
+        generated_docs = []
+        for combination, prompt_filled, generated_fragment, fragment_id in zip(combinations, prompt_filled_list, results, fragment_ids):
+            if not streamed_single:
+                st.write("Using prompt: ", prompt_filled)
+
+            if isinstance(generated_fragment, Exception):
+                if not streamed_single:
+                    st.error(f"Error generating fragment: {str(generated_fragment)}")
+                continue
+
+            if not streamed_single:
+                st.write(generated_fragment)
+
+            combination["FragmentID"] = fragment_id
             combination["Content"] = generated_fragment
             combination["Origin"] = "Machine"
             combination["MachineModel"] = user_generator_model
             combination["MachinePrompt"] = prompt_filled
             combination["IsFake"] = user_is_fakenews
-            combination["CreationDate"] = datetime.today()
+            combination["CreationDate"] = batch_creation_date
 
-            save_fragment(combination)
+            generated_docs.append(combination)
 
             # Add a separator for clarity between prompts
             st.markdown("---")
 
+        # Persist the whole batch in a single bulk write
+        save_fragments(generated_docs)
+
 
 
 
 # UI to input news fragment details
 st.title("News Ingestion")
 
-tab_generaor, tab_manual, tab_news = st.tabs(["Generator", "Manual Data Entry", "Automated news import"])
-
-with tab_generaor:
-    automatic_news_generation_ui()
-
-with tab_manual:
+# Shared, cached setup used by both generation tabs
+config_data = load_config()
+config_keys_set = frozenset(collect_config_keys(config_data["Components"]))
+
+# st.tabs runs every tab body on each rerun, doubling the per-interaction
+# work; a radio-based switcher only executes the selected section
+active_tab = st.radio(
+    "Mode",
+    ["Generator", "Manual Data Entry", "Automated news import"],
+    horizontal=True,
+    label_visibility="collapsed"
+)
+
+if active_tab == "Generator":
+    automatic_news_generation_ui(config_data, config_keys_set)
+elif active_tab == "Manual Data Entry":
     manual_data_entry_ui()
-
-with tab_news:
-    news_from_trends_ui()
\ No newline at end of file
+else:
+    news_from_trends_ui(config_data, config_keys_set)
\ No newline at end of file
@@ -1,8 +1,19 @@
 from googletrends import get_google_trends
 from newsapi import NewsApiClient
+import requests
+from requests.adapters import HTTPAdapter
 
 key = 'c0a7fb769ee4458cb4ec3fcc53e89dd7'
-api = NewsApiClient(api_key=key)
+
+# Shared session with a larger pooled adapter: keep-alive connections are
+# reused across lookups instead of paying a TCP+TLS handshake per call, and
+# concurrent lookups from a thread pool don't exhaust the default pool of 10
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+session.mount('https://', adapter)
+session.mount('http://', adapter)
+
+api = NewsApiClient(api_key=key, session=session)
 
 class Article:
     def __init__(self, title, description, url):